@@ -23,7 +23,6 @@ import sys       # used for exiting the program if errors occur
 from . import config                # load configuration defaults
 from .crawler import Crawler        # main crawling engine
 from .indexer import Indexer        # build inverted index
-from .signals import extract_signals  # detect sales/lead signals
 from .store import save_results     # save data to JSON or CSV
 
 
@@ -81,12 +80,13 @@ def main():
     indexer.build_index(documents)
     print(f"[Spider] Index built with {len(indexer.index)} unique terms.")
 
-    # Extract sales/lead signals from the crawled documents
+    # Collect the sales/lead signals the crawler already extracted while
+    # the page text was hot (no second pass over the documents)
     signals = []
     for doc in documents:
-        found = extract_signals(doc.get("text", ""))
-        if found:
-            signals.append({"url": doc["url"], "signals": found})
+        found = doc.get("signals", {})
+        if found.get("emails") or found.get("phones") or found.get("ctas"):
+            signals.append(found)
     print(f"[Spider] Signals extracted from {len(signals)} documents.")
 
     # Save results (documents, index, and signals)
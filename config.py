@@ -29,6 +29,12 @@ REQUEST_RETRIES = 2  # retries help recover from temporary errors
 # Delay (in seconds) between retries after a failure
 RETRY_DELAY = 1.0  # avoids hammering the same server repeatedly
 
+# Per-host politeness limit (requests per second)
+POLITENESS_RPS = 2.0  # keeps workers from flooding a single host
+
+# Burst allowance for the per-host rate limiter
+POLITENESS_BURST = 5  # short bursts are fine; sustained rate is capped
+
 # User-Agent string to identify the crawler to web servers
 USER_AGENT = "Spider/0.1 (https://github.com/marvelspft01/spider)"
 
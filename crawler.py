@@ -1,72 +1,240 @@
+import asyncio
+import collections
+import concurrent.futures
+import os
 import threading
-import queue
-from typing import List, Dict
-from .fetcher import fetch_url
+import time
+from typing import List, Dict, Optional
+from urllib.parse import urlparse
+
+import aiohttp
+
+from . import config
+from .fetcher import canonicalize_url, fetch_raw
 from .parser import parse_html
+from .signals import extract_signals
+
+# pybloom_live gives a ~1-2 bits/URL probabilistic pre-filter for the
+# visited check; fall back to the exact set alone if it is not installed
+try:
+    from pybloom_live import ScalableBloomFilter
+except ImportError:
+    ScalableBloomFilter = None
+
+
+class TokenBucket:
+    """
+    Per-host politeness rate limiter.
+
+    Each host refills tokens at `rate` per second up to `burst`; a worker
+    takes a token before fetching and sleeps (cheaply, as a coroutine)
+    for the returned delay when the bucket is empty. On 429/503 replies
+    the bucket's refill rate is halved, so throughput backs off on hosts
+    that ask for it instead of burning retries against them.
+    """
+
+    def __init__(self, rate: float, burst: int = 5):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how long to wait before sending.
+
+        Returns 0.0 when a token is available immediately; otherwise the
+        number of seconds until the reserved token is refilled.
+        """
+        with self._lock:
+            now = time.monotonic()
+            # refill based on elapsed time, capped at the burst size
+            self.tokens = min(
+                float(self.burst), self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # take the token (possibly going negative = reserved ahead)
+            self.tokens -= 1.0
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def throttle(self):
+        """Halve the refill rate after a 429/503 from this host."""
+        with self._lock:
+            self.rate = max(self.rate / 2.0, 0.1)
+
+
+def process_document(url: str, html) -> Dict:
+    """
+    Parse raw HTML into a fully enriched document in one pass.
+
+    Runs parse (which also tokenizes) and signal extraction back to back
+    while the text is hot, and attaches the signals under "signals", so
+    downstream consumers like the CLI do not re-scan every document in a
+    second loop.
+    """
+    doc = parse_html(url, html)
+    doc["signals"] = extract_signals(doc)
+    return doc
 
 
 class Crawler:
     """
-    Multithreaded web crawler.
-    
+    Asynchronous web crawler.
+
     Responsibilities:
         - Manage crawl queue
-        - Dispatch worker threads
-        - Fetch pages using fetcher
-        - Parse HTML using parser
+        - Dispatch worker coroutines on a single event loop
+        - Fetch pages using fetcher (shared aiohttp connection pool)
+        - Parse and enrich pages in a process pool (CPU-bound stage)
         - Collect crawled documents for indexing
     """
 
     def __init__(self, seed_urls: List[str], max_pages: int = 100, num_threads: int = 5):
         self.seed_urls = seed_urls
         self.max_pages = max_pages
+        # kept name for back-compat; now the number of worker coroutines
         self.num_threads = num_threads
 
-        self.queue = queue.Queue()
-        self.visited = set()
+        # plain deque instead of queue.Queue/asyncio.Queue: the frontier
+        # is already protected by _lock, so the Queue machinery (its own
+        # lock, not_empty/not_full bookkeeping) would only double the
+        # synchronization cost per enqueue/dequeue
+        self.queue: collections.deque = collections.deque()
+        self.visited = set()  # exact fallback behind the bloom filter
         self.results: List[Dict] = []
 
-        # seed the queue
-        for url in seed_urls:
-            self.queue.put(url)
+        # probabilistic pre-filter for visited membership: a negative
+        # answer is definitive, so the common "never seen this URL"
+        # case skips hashing into the (much larger) exact set
+        if ScalableBloomFilter is not None:
+            self._bloom = ScalableBloomFilter(
+                initial_capacity=100_000, error_rate=1e-5)
+        else:
+            self._bloom = None
 
-    def worker(self):
-        """Worker thread: fetch and parse pages from the queue."""
-        while not self.queue.empty() and len(self.results) < self.max_pages:
-            try:
-                url = self.queue.get_nowait()
-            except queue.Empty:
-                break
+        # guards queue/visited/results so claiming a URL is atomic even
+        # if workers are ever driven from more than one thread
+        self._lock = threading.Lock()
 
-            if url in self.visited:
-                continue
+        # pages currently being fetched or parsed (may still discover links)
+        self._in_flight = 0
 
-            self.visited.add(url)
+        # process pool for the CPU-bound parse/tokenize/signals stage;
+        # created per run in _crawl, None outside a crawl
+        self._parse_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
 
-            html = fetch_url(url)
-            if not html:
-                continue
+        # per-host politeness rate limiters, created on first request
+        self.buckets: Dict[str, TokenBucket] = collections.defaultdict(
+            lambda: TokenBucket(rate=config.POLITENESS_RPS,
+                                burst=config.POLITENESS_BURST))
 
-            doc = parse_html(url, html)
-            self.results.append(doc)
+        # seed the queue; claiming up front also dedupes the seed list
+        for url in seed_urls:
+            self._claim(url)
+
+    def _claim(self, url: str) -> bool:
+        """
+        Atomically reserve a URL for fetching and enqueue it.
+
+        Returns True only if the URL was newly inserted into visited and
+        there is still page budget left; visited-membership and enqueue
+        happen under one lock acquisition, so no URL is ever enqueued or
+        fetched twice. URLs are canonicalized first, so different
+        spellings of the same page (trailing slash, fragment, query
+        order) collapse to a single claim.
+        """
+        url = canonicalize_url(url)
+
+        with self._lock:
+            if len(self.results) >= self.max_pages:
+                return False
+
+            if self._bloom is not None:
+                # bloom negative = definitely new; only a positive needs
+                # confirming against the exact set (false-positive rate 1e-5)
+                if url in self._bloom and url in self.visited:
+                    return False
+                self._bloom.add(url)
+            elif url in self.visited:
+                return False
+
+            self.visited.add(url)
+            self.queue.append(url)
+            return True
+
+    def _next_url(self) -> Optional[str]:
+        """Pop the next claimed URL from the frontier, or None if empty."""
+        with self._lock:
+            return self.queue.popleft() if self.queue else None
+
+    async def worker(self, session: aiohttp.ClientSession):
+        """Worker coroutine: fetch and parse pages from the queue."""
+        while len(self.results) < self.max_pages:
+            url = self._next_url()
+            if url is None:
+                if self._in_flight == 0:
+                    break
+                # in-flight fetches may still enqueue links; yield and retry
+                await asyncio.sleep(0.05)
+                continue
 
-            # enqueue new links if we have space
-            for link in doc.get("outbound_links", []):
-                if len(self.results) < self.max_pages and link not in self.visited:
-                    self.queue.put(link)
+            # every URL in the queue was claimed before being enqueued,
+            # so it is safe to fetch without re-checking visited.
+            # Count the page in-flight from the moment it leaves the
+            # queue until its outbound links are claimed - including the
+            # politeness sleep below, during which the URL would
+            # otherwise be invisible to idle workers deciding whether
+            # the crawl is over
+            self._in_flight += 1
+            try:
+                # politeness: take a token for this host, waiting out
+                # the bucket if it is empty (only this coroutine sleeps)
+                bucket = self.buckets[urlparse(url).hostname or ""]
+                wait = bucket.reserve()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
+                html = await fetch_raw(session, url, on_throttle=bucket.throttle)
+                if not html:
+                    continue
+
+                # parse + tokenize + signals in one pass over the raw
+                # bytes, offloaded to the process pool: the CPU-bound
+                # stage runs on other cores instead of stalling the
+                # fetch loop behind the GIL
+                loop = asyncio.get_running_loop()
+                doc = await loop.run_in_executor(
+                    self._parse_pool, process_document, url, html)
+                self.results.append(doc)
+
+                # enqueue new links if we have space; _claim enqueues in
+                # the same critical section, so a link reachable from
+                # many pages is enqueued exactly once
+                for link in doc.get("outbound_links", []):
+                    self._claim(link)
+            finally:
+                self._in_flight -= 1
+
+    async def _crawl(self) -> List[Dict]:
+        """Open the shared session and drive the worker coroutines."""
+        connector = aiohttp.TCPConnector(
+            limit=self.num_threads * 20, ttl_dns_cache=300)
+
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=os.cpu_count()) as pool:
+            self._parse_pool = pool
+            try:
+                async with aiohttp.ClientSession(connector=connector) as session:
+                    workers = [asyncio.create_task(self.worker(session))
+                               for _ in range(self.num_threads)]
+                    await asyncio.gather(*workers)
+            finally:
+                self._parse_pool = None
 
-            self.queue.task_done()
+        return self.results
 
     def run(self) -> List[Dict]:
         """Start the crawl and return parsed documents."""
-        threads = []
-
-        for _ in range(self.num_threads):
-            t = threading.Thread(target=self.worker, daemon=True)
-            threads.append(t)
-            t.start()
-
-        for t in threads:
-            t.join()
-
-        return self.results
+        return asyncio.run(self._crawl())
@@ -2,72 +2,251 @@
 # fetcher.py
 #
 # This module handles the low-level task of fetching web pages.
-# It sends HTTP requests to URLs, applies headers like User-Agent,
-# retries failed requests, respects timeouts, and only returns HTML
-# pages (ignores non-HTML responses like images or PDFs).
+# It sends asynchronous HTTP requests to URLs, applies headers like
+# User-Agent, retries failed requests, respects timeouts, and only
+# returns HTML pages (ignores non-HTML responses like images or PDFs).
+#
+# Requests go through aiohttp so many fetches can be in flight on a
+# single thread, and a shared connection pool keeps sockets alive
+# between requests instead of paying a TCP/TLS handshake per page.
 #
 # In short: this is the "downloader" part of the web crawler.
 # ================================================================
 
-# Import the urllib.request module for making HTTP requests
-import urllib.request
+# Import asyncio so coroutines can sleep and the sync wrapper can run a loop
+import asyncio
+
+# Import collections for the OrderedDict behind the body cache
+import collections
 
-# Import urllib.error to handle specific errors like HTTPError or URLError
-import urllib.error
+# Import socket so the DNS cache can wrap the system resolver
+import socket
 
-# Import time so we can pause (sleep) between retry attempts
+# Import threading for the lock protecting the DNS cache
+import threading
+
+# Import time for the DNS cache expiry timestamps
 import time
 
+# Import aiohttp for pooled, non-blocking HTTP requests
+import aiohttp
+
 # Import Optional for type hinting: function may return a string or None
-from typing import Optional
+from typing import Dict, Optional
 
+# Import URL helpers for canonicalization (cache/dedup keys)
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-def fetch_url(url: str, timeout: int = 5, retries: int = 2, delay: float = 1.0) -> Optional[str]:
+# Import the parser so fetch_and_parse can hand bytes straight to it
+from .parser import parse_html
+
+# Headers sent with every request to identify the crawler to web servers
+_HEADERS = {
+    "User-Agent": "Spider/0.1 (https://github.com/marvelspft01/spider)"
+}
+
+# How long (in seconds) resolved hostnames stay cached
+_DNS_TTL = 300
+
+
+class DNSCache:
+    """
+    Small TTL'd cache in front of socket.getaddrinfo.
+
+    A crawl hits the same handful of hosts over and over, but every new
+    connection normally pays a fresh (blocking, often 10-100 ms) DNS
+    lookup. Caching resolutions for a few minutes turns all but the
+    first lookup per host into a dict read. install() patches the cache
+    in process-wide so every resolver path benefits, including the
+    one-off sessions made by the synchronous fetch_url wrapper.
+    """
+
+    def __init__(self, ttl: float = _DNS_TTL):
+        self.ttl = ttl
+        # key = getaddrinfo arguments, value = (result, expiry timestamp)
+        self._cache = {}
+        self._lock = threading.Lock()
+        # keep a reference to the real resolver before patching
+        self._getaddrinfo = socket.getaddrinfo
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        """Resolve like socket.getaddrinfo, serving unexpired hits from cache."""
+        key = (host, port, family, type, proto, flags)
+        now = time.monotonic()
+
+        with self._lock:
+            hit = self._cache.get(key)
+            if hit is not None and hit[1] > now:
+                return hit[0]
+
+        # Miss or expired: do the real (blocking) lookup outside the lock
+        result = self._getaddrinfo(host, port, family, type, proto, flags)
+
+        with self._lock:
+            self._cache[key] = (result, now + self.ttl)
+
+        return result
+
+    def install(self):
+        """Replace socket.getaddrinfo with the caching version."""
+        socket.getaddrinfo = self.getaddrinfo
+
+
+# Shared cache, installed at import time; the crawler's TCPConnector
+# keeps its own ttl_dns_cache as well, but this also covers sessions
+# (and event loops) created per call by the sync wrapper
+_dns_cache = DNSCache()
+_dns_cache.install()
+
+# Total bytes of fetched bodies kept in the in-process cache
+_BODY_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so equivalent spellings share one cache/dedup key.
+
+    Lowercases the scheme and host, drops default ports and fragments,
+    defaults an empty path to "/", and sorts query parameters, so e.g.
+    http://A.com:80/x?b=2&a=1#top and http://a.com/x?a=1&b=2 collapse
+    to the same key.
     """
-    Fetch the content of a URL using urllib from Python's standard library.
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+
+    # strip the default port for the scheme
+    if scheme == "http" and netloc.endswith(":80"):
+        netloc = netloc[:-3]
+    elif scheme == "https" and netloc.endswith(":443"):
+        netloc = netloc[:-4]
+
+    path = parts.path or "/"
+    query = urlencode(sorted(parse_qsl(parts.query)))
+
+    # fragment is client-side only; never part of the request
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+class BodyCache:
+    """
+    LRU cache of fetched page bodies, capped by total bytes.
+
+    HTML bodies are big, so the cache evicts by accumulated size rather
+    than entry count: least-recently-used pages are dropped until the
+    total fits under max_bytes. Repeat fetches of a URL (same page
+    reached again, or CLI re-runs inside one process) become a dict
+    lookup instead of an HTTP round trip.
+    """
+
+    def __init__(self, max_bytes: int = _BODY_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        # key = canonical URL, value = body bytes; insertion order
+        # doubles as recency order
+        self._data: "collections.OrderedDict[str, bytes]" = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached body for key, refreshing its recency."""
+        with self._lock:
+            body = self._data.get(key)
+            if body is not None:
+                self._data.move_to_end(key)
+            return body
+
+    def put(self, key: str, body: bytes):
+        """Insert a body, evicting least-recently-used entries to fit."""
+        # bodies larger than the whole budget would just thrash the cache
+        if len(body) > self.max_bytes:
+            return
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+
+            self._data[key] = body
+            self._size += len(body)
+
+            # evict from the least-recently-used end until we fit
+            while self._size > self.max_bytes:
+                _, evicted = self._data.popitem(last=False)
+                self._size -= len(evicted)
+
+
+# Shared across all fetch paths in the process
+_body_cache = BodyCache()
+
+
+async def fetch_raw(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: int = 5,
+    retries: int = 2,
+    delay: float = 1.0,
+    on_throttle=None,
+) -> Optional[bytes]:
+    """
+    Fetch the raw body of a URL through a shared aiohttp session.
 
     Args:
+        session (aiohttp.ClientSession): Shared session with a pooled connector.
         url (str): The target URL to fetch.
-        timeout (int): Timeout in seconds for the request.
+        timeout (int): Total timeout in seconds for the request.
         retries (int): Number of retry attempts on failure.
         delay (float): Delay (in seconds) between retries.
+        on_throttle (Optional[Callable]): Called (no args) when the server
+            answers 429 or 503, so callers can slow down for this host.
 
     Returns:
-        Optional[str]: The HTML content of the page, or None if fetching failed.
+        Optional[bytes]: The undecoded HTML body, or None if fetching failed.
     """
+    # Serve repeat fetches straight from the in-process body cache
+    cache_key = canonicalize_url(url)
+    cached = _body_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Keep track of how many attempts we've made
     attempt = 0
 
     # Keep trying until we've reached the allowed number of retries
     while attempt <= retries:
         try:
-            # Create a request object with a custom User-Agent
-            # This makes our crawler look "polite" and identifiable to servers
-            req = urllib.request.Request(
+            # Issue the request on the shared session so the connection
+            # pool can reuse an already-open socket for this host
+            async with session.get(
                 url,
-                headers={
-                    "User-Agent": "Spider/0.1 (https://github.com/marvelspft01/spider)"
-                },
-            )
-
-            # Open the URL with the specified timeout
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-
-                # Check the "Content-Type" header to ensure it's HTML
-                if "text/html" in response.headers.get("Content-Type", ""):
-                    # If it's HTML, decode the bytes into a string (UTF-8)
-                    return response.read().decode("utf-8", errors="ignore")
+                headers=_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+
+                # Treat HTTP error statuses (404, 500, ...) like urllib did
+                response.raise_for_status()
+
+                # Check the content type to ensure it's HTML
+                if response.content_type == "text/html":
+                    # If it's HTML, cache and hand back the raw bytes
+                    body = await response.read()
+                    _body_cache.put(cache_key, body)
+                    return body
                 else:
                     # If it's not HTML (e.g., image, PDF), ignore and return None
                     return None
 
         # Handle common network errors like 404, 500, or connection issues
-        except (urllib.error.HTTPError, urllib.error.URLError, TimeoutError) as e:
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Tell the caller the host asked us to back off
+            if (on_throttle is not None
+                    and isinstance(e, aiohttp.ClientResponseError)
+                    and e.status in (429, 503)):
+                on_throttle()
             # Print a simple error message with retry attempt info
             print(
                 f"[FetchError] {url} ({e}) - attempt {attempt+1}/{retries+1}")
-            # Wait before retrying
-            time.sleep(delay)
+            # Wait before retrying (non-blocking: only this coroutine sleeps)
+            await asyncio.sleep(delay)
             # Increase attempt counter
             attempt += 1
 
@@ -79,3 +258,137 @@ def fetch_url(url: str, timeout: int = 5, retries: int = 2, delay: float = 1.0)
 
     # If all retries fail, return None (signal that fetch failed)
     return None
+
+
+async def fetch_url_async(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: int = 5,
+    retries: int = 2,
+    delay: float = 1.0,
+) -> Optional[str]:
+    """
+    Fetch the content of a URL through a shared aiohttp session.
+
+    Args:
+        session (aiohttp.ClientSession): Shared session with a pooled connector.
+        url (str): The target URL to fetch.
+        timeout (int): Total timeout in seconds for the request.
+        retries (int): Number of retry attempts on failure.
+        delay (float): Delay (in seconds) between retries.
+
+    Returns:
+        Optional[str]: The HTML content of the page, or None if fetching failed.
+    """
+    raw = await fetch_raw(session, url, timeout=timeout, retries=retries, delay=delay)
+    if raw is None:
+        return None
+    return raw.decode("utf-8", errors="ignore")
+
+
+async def fetch_and_parse(
+    session: aiohttp.ClientSession,
+    url: str,
+    timeout: int = 5,
+    retries: int = 2,
+    delay: float = 1.0,
+) -> Optional[Dict]:
+    """
+    Fetch a URL and parse it into a structured document in one step.
+
+    Fusing the two stages skips the intermediate decode that
+    fetch_url_async performs: the raw bytes from the socket go straight
+    into the HTML parser (selectolax decodes inside its C engine), so
+    the body is not copied through an extra full-size Python string.
+
+    Args:
+        session (aiohttp.ClientSession): Shared session with a pooled connector.
+        url (str): The target URL to fetch.
+        timeout (int): Total timeout in seconds for the request.
+        retries (int): Number of retry attempts on failure.
+        delay (float): Delay (in seconds) between retries.
+
+    Returns:
+        Optional[Dict]: The parsed document dictionary, or None if the
+        fetch failed or the response was not HTML.
+    """
+    raw = await fetch_raw(session, url, timeout=timeout, retries=retries, delay=delay)
+    if raw is None:
+        return None
+    return parse_html(url, raw)
+
+
+class _SyncFetcher:
+    """
+    Background event loop + shared session for synchronous callers.
+
+    fetch_url used to build a fresh event loop and ClientSession per
+    call, so every synchronous fetch paid a new TCP/TLS handshake even
+    when hammering the same host. Instead, one daemon thread runs a
+    long-lived event loop holding a single pooled session; sync calls
+    submit their coroutine to that loop and block on the result, so
+    keep-alive connections are reused across calls just like in the
+    crawler's shared session. Safe to call from multiple threads: all
+    session use happens on the loop thread.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _ensure_started(self):
+        """Start the loop thread and shared session on first use."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(
+                    target=loop.run_forever, daemon=True, name="spider-sync-fetch")
+                thread.start()
+
+                async def _make_session() -> aiohttp.ClientSession:
+                    # the session must be created on its event loop
+                    connector = aiohttp.TCPConnector(
+                        limit=20, ttl_dns_cache=_DNS_TTL)
+                    return aiohttp.ClientSession(connector=connector)
+
+                self._session = asyncio.run_coroutine_threadsafe(
+                    _make_session(), loop).result()
+                self._loop = loop
+
+        return self._loop, self._session
+
+    def fetch(self, url: str, timeout: int, retries: int, delay: float) -> Optional[str]:
+        """Run fetch_url_async on the background loop and wait for it."""
+        loop, session = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(
+            fetch_url_async(session, url, timeout=timeout,
+                            retries=retries, delay=delay),
+            loop,
+        )
+        return future.result()
+
+
+# Shared by all synchronous fetch_url calls in the process
+_sync_fetcher = _SyncFetcher()
+
+
+def fetch_url(url: str, timeout: int = 5, retries: int = 2, delay: float = 1.0) -> Optional[str]:
+    """
+    Fetch the content of a URL synchronously.
+
+    Kept for backwards compatibility: requests are serviced by a shared
+    pooled session on a background event loop, so repeated calls reuse
+    keep-alive connections. Callers already inside an event loop should
+    use fetch_url_async with their own session instead.
+
+    Args:
+        url (str): The target URL to fetch.
+        timeout (int): Timeout in seconds for the request.
+        retries (int): Number of retry attempts on failure.
+        delay (float): Delay (in seconds) between retries.
+
+    Returns:
+        Optional[str]: The HTML content of the page, or None if fetching failed.
+    """
+    return _sync_fetcher.fetch(url, timeout, retries, delay)
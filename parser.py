@@ -16,11 +16,24 @@
 from html.parser import HTMLParser
 
 # Import typing tools for clarity: Dict for structured return, List for link lists
-from typing import Dict, List
+from typing import Dict, List, Union
+
+# Import the shared tokenizer so pages are tokenized once, at parse time
+from .indexer import tokenize
+
+# Prefer selectolax (the Modest engine, written in C): it parses pages
+# orders of magnitude faster than the character-at-a-time pure-Python
+# HTMLParser. Fall back to the stdlib parser if it is not installed.
+try:
+    from selectolax.parser import HTMLParser as FastHTML
+except ImportError:
+    FastHTML = None
 
 
 class SimpleHTMLParser(HTMLParser):
     """
+    Pure-Python fallback parser, used only when selectolax is unavailable.
+
     A simple subclass of HTMLParser that:
       - Captures text data between tags
       - Extracts href links from <a> tags
@@ -34,11 +47,18 @@ class SimpleHTMLParser(HTMLParser):
         self.text_parts: List[str] = []
         # Store all outbound links (href values from <a> tags)
         self.links: List[str] = []
-        # Store the title of the page (if <title> tag is found)
-        self.title: str = ""
+        # Collect title fragments and join once at the end: repeated
+        # str += is accidentally quadratic when a title arrives in many
+        # data chunks (entities, line breaks)
+        self._title_parts: List[str] = []
         # Boolean flag to check if we are inside a <title> tag
         self.in_title: bool = False
 
+    @property
+    def title(self) -> str:
+        """The <title> text collected so far."""
+        return "".join(self._title_parts)
+
     def handle_starttag(self, tag: str, attrs: List[tuple]):
         """
         Called when the parser encounters an opening tag like <a> or <title>.
@@ -69,42 +89,67 @@ class SimpleHTMLParser(HTMLParser):
         # Clean up the text by stripping whitespace
         clean_data = data.strip()
 
-        # If we're inside <title>, save this text as the page title
+        # If we're inside <title>, save this text as a title fragment
         if self.in_title:
-            self.title += clean_data
+            self._title_parts.append(clean_data)
 
         # If it's non-empty text (like paragraph text), store it in text_parts
         if clean_data:
             self.text_parts.append(clean_data)
 
 
-def parse_html(url: str, html: str) -> Dict:
+def parse_html(url: str, html: Union[str, bytes]) -> Dict:
     """
     Parse raw HTML into a structured document dictionary.
 
     Args:
         url (str): The URL of the page.
-        html (str): The raw HTML content.
+        html (Union[str, bytes]): The raw HTML content. Bytes are passed
+            to selectolax undecoded (its C engine handles decoding), so
+            fetchers can skip producing an intermediate Python string.
 
     Returns:
         Dict: A structured dictionary with:
             - "url": the page's URL
             - "title": the <title> text (or empty if not found)
             - "text": combined visible text content
+            - "tokens": lowercase word tokens of the text content
             - "outbound_links": list of href links
     """
-    # Create a parser instance
-    parser = SimpleHTMLParser()
-    # Feed the raw HTML into the parser
-    parser.feed(html)
+    if FastHTML is not None:
+        # Parse with the C engine: one call builds the whole tree
+        tree = FastHTML(html)
+
+        # Extract the <title> text if the tag exists
+        title_node = tree.css_first("title")
+        title = title_node.text() if title_node else ""
+
+        # Extract the visible text of the page body
+        text_content = tree.body.text(separator=" ") if tree.body else ""
+
+        # Collect href values from all <a> tags
+        links = [a.attrs.get("href", "") for a in tree.css("a[href]")]
+
+    else:
+        # Fallback: the pure-Python parser only accepts strings
+        if isinstance(html, bytes):
+            html = html.decode("utf-8", errors="ignore")
+
+        # Feed the raw HTML through the pure-Python parser
+        parser = SimpleHTMLParser()
+        parser.feed(html)
 
-    # Combine all text parts into one big string, separated by spaces
-    text_content = " ".join(parser.text_parts)
+        title = parser.title
+        # Combine all text parts into one big string, separated by spaces
+        text_content = " ".join(parser.text_parts)
+        links = parser.links
 
-    # Return the structured document dictionary
+    # Return the structured document dictionary; tokenizing here means
+    # downstream consumers (indexer, signals) reuse one scan of the text
     return {
         "url": url,
-        "title": parser.title,
+        "title": title,
         "text": text_content,
-        "outbound_links": parser.links,
+        "tokens": tokenize(text_content),
+        "outbound_links": links,
     }
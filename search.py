@@ -8,43 +8,46 @@
 # In short: this is the "retrieval layer" for Spider.
 # ================================================================
 
-from typing import Dict, List
+import heapq
 
+from collections import Counter
+from itertools import islice
+from operator import itemgetter
+from typing import Dict, Iterable, List
 
-def search(index: Dict[str, List[str]], query: str) -> List[str]:
+
+def search(index: Dict[str, Iterable], query: str, k: int = 50) -> List:
     """
-    Search the inverted index for documents matching the query.
+    Search the inverted index for the top documents matching the query.
 
     Args:
-        index (Dict[str, List[str]]): The inverted index
+        index (Dict[str, Iterable]): The inverted index
             - Keys: words
-            - Values: list of document URLs containing the word
+            - Values: postings (doc ids or URLs) containing the word
         query (str): The user’s search query (e.g., "python crawler")
+        k (int): Maximum number of results to return.
 
     Returns:
-        List[str]: Ranked list of matching document URLs
+        List: Ranked list of at most k matching postings
     """
     # Split query string into individual terms (case-insensitive)
     terms = query.lower().split()
 
-    # Dictionary to store scores per document
-    scores: Dict[str, int] = {}
+    # Single-term queries need no scoring: every match scores 1
+    if len(terms) == 1:
+        return list(islice(index.get(terms[0], ()), k))
 
-    # For each term in the query
+    # Counter.update tallies each posting list in one C-level pass,
+    # replacing the per-document get/increment loop
+    scores: Counter = Counter()
     for term in terms:
-        # If the term is not in the index, skip it
-        if term not in index:
-            continue
-
-        # For each document containing this term
-        for doc in index[term]:
-            # Increase its score (frequency count)
-            scores[doc] = scores.get(doc, 0) + 1
+        scores.update(index.get(term, ()))
 
-    # Sort documents by score (descending order)
-    ranked_docs = sorted(scores, key=lambda d: scores[d], reverse=True)
+    # Only the top k are wanted, so nlargest's O(N log k) selection
+    # beats fully sorting all matching documents
+    ranked = heapq.nlargest(k, scores.items(), key=itemgetter(1))
 
-    return ranked_docs
+    return [doc for doc, _ in ranked]
 
 
 def pretty_print_results(results: List[str], query: str) -> None:
@@ -18,51 +18,152 @@ import re
 # Import typing for clarity: Dict (structured document) and List (lists of signals)
 from typing import Dict, List
 
+# pyahocorasick is a C extension; fall back to plain substring search
+# if it is not installed
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# hyperscan compiles all patterns into one SIMD-vectorized DFA, letting
+# extract_signals match emails, phones and CTAs in a single scan; fall
+# back to the regex + automaton path if it is not installed
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Patterns are compiled once at module load instead of on every call,
+# so the per-call regex-cache lookup is skipped on hot crawl paths.
+
+# Regex pattern to match emails (simple version)
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+# Regex pattern for phone-like numbers (e.g. +123-456-7890 or 1234567890)
+_PHONE_RE = re.compile(r"(\+?\d[\d\-\s]{7,}\d)")
+
+# Combined pattern with named groups so one pass over the text finds
+# both signal types (pages can be megabytes of text)
+_SIGNAL_RE = re.compile(
+    rf"(?P<email>{_EMAIL_RE.pattern})|(?P<phone>{_PHONE_RE.pattern})"
+)
+
 
 def extract_emails(text: str) -> List[str]:
     """
     Extract all email addresses from text using regex.
     """
-    # Regex pattern to match emails (simple version)
-    pattern = r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-    return re.findall(pattern, text)
+    return _EMAIL_RE.findall(text)
 
 
 def extract_phone_numbers(text: str) -> List[str]:
     """
     Extract phone numbers (basic patterns like +123-456-7890 or 1234567890).
     """
-    # Regex pattern for phone-like numbers
-    pattern = r"(\+?\d[\d\-\s]{7,}\d)"
-    return re.findall(pattern, text)
+    return _PHONE_RE.findall(text)
+
+
+# List of common CTAs (can be expanded)
+_CTA_LIST = [
+    "contact us",
+    "get a quote",
+    "buy now",
+    "sign up",
+    "subscribe",
+    "free trial",
+    "request demo",
+    "book a call",
+]
+
+# Build the Aho-Corasick automaton once at import time: it matches every
+# CTA phrase in a single O(len(text)) pass, instead of one substring
+# scan per phrase, and stays O(1) in passes as the CTA list grows
+if ahocorasick is not None:
+    _CTA_AC = ahocorasick.Automaton()
+    for _cta in _CTA_LIST:
+        _CTA_AC.add_word(_cta, _cta)
+    _CTA_AC.make_automaton()
+else:
+    _CTA_AC = None
+
+
+# Multi-pattern Hyperscan database covering every signal type, compiled
+# once at import: pattern ids 0 and 1 are the email and phone regexes
+# (with start-of-match tracking so the matched text can be sliced out),
+# and ids 2+ are the CTA phrases matched caselessly.
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=(
+                [_EMAIL_RE.pattern.encode(), _PHONE_RE.pattern.encode()]
+                + [re.escape(c).encode() for c in _CTA_LIST]
+            ),
+            ids=list(range(2 + len(_CTA_LIST))),
+            flags=(
+                [hyperscan.HS_FLAG_SOM_LEFTMOST] * 2
+                + [hyperscan.HS_FLAG_CASELESS] * len(_CTA_LIST)
+            ),
+        )
+    except Exception:
+        # some pattern constructs are not supported by every build;
+        # fall back to the regex + automaton path in that case
+        _HS_DB = None
 
 
 def extract_cta_phrases(text: str) -> List[str]:
     """
     Extract call-to-action (CTA) phrases commonly used on business websites.
     """
-    # List of common CTAs (can be expanded)
-    cta_list = [
-        "contact us",
-        "get a quote",
-        "buy now",
-        "sign up",
-        "subscribe",
-        "free trial",
-        "request demo",
-        "book a call",
-    ]
-
-    found_ctas = []
     # Lowercase the text so search is case-insensitive
     text_lower = text.lower()
 
-    # Check if each CTA phrase appears in the text
-    for cta in cta_list:
-        if cta in text_lower:
-            found_ctas.append(cta)
+    if _CTA_AC is not None:
+        # Single pass over the text matches all CTA phrases at once
+        found = {value for _, value in _CTA_AC.iter(text_lower)}
+        # Keep the stable _CTA_LIST ordering for deterministic output
+        return [cta for cta in _CTA_LIST if cta in found]
+
+    # Fallback: check each CTA phrase with a substring scan
+    return [cta for cta in _CTA_LIST if cta in text_lower]
+
+
+def _scan_signals_hyperscan(text: str):
+    """
+    Match every signal type in one pass over the text via Hyperscan.
+
+    Hyperscan reports a match event for every possible match end, so for
+    emails/phones we keep only the longest span per start offset to get
+    the same "greedy" results the regexes produce.
+
+    Returns:
+        Tuple of (emails, phones, ctas) lists.
+    """
+    # Hyperscan scans bytes; offsets below index into this buffer
+    data = text.encode("utf-8", errors="ignore")
+
+    email_spans: Dict[int, int] = {}
+    phone_spans: Dict[int, int] = {}
+    cta_ids = set()
+
+    def on_match(pat_id, start, end, flags, context=None):
+        if pat_id == 0:
+            email_spans[start] = max(email_spans.get(start, 0), end)
+        elif pat_id == 1:
+            phone_spans[start] = max(phone_spans.get(start, 0), end)
+        else:
+            cta_ids.add(pat_id - 2)
+
+    _HS_DB.scan(data, match_event_handler=on_match)
+
+    emails = [data[s:e].decode("utf-8", errors="ignore")
+              for s, e in sorted(email_spans.items())]
+    phones = [data[s:e].decode("utf-8", errors="ignore")
+              for s, e in sorted(phone_spans.items())]
+    ctas = [cta for i, cta in enumerate(_CTA_LIST) if i in cta_ids]
 
-    return found_ctas
+    return emails, phones, ctas
 
 
 def extract_signals(doc: Dict) -> Dict:
@@ -84,10 +185,22 @@ def extract_signals(doc: Dict) -> Dict:
     # Get the text content of the document (default empty if missing)
     text = doc.get("text", "")
 
-    # Run all extraction functions
-    emails = extract_emails(text)
-    phones = extract_phone_numbers(text)
-    ctas = extract_cta_phrases(text)
+    if _HS_DB is not None:
+        # Single vectorized scan matches every signal type at once
+        emails, phones, ctas = _scan_signals_hyperscan(text)
+    else:
+        # One combined regex scan finds emails and phones together
+        # instead of walking the full text once per signal type
+        emails = []
+        phones = []
+        for match in _SIGNAL_RE.finditer(text):
+            email = match.group("email")
+            if email is not None:
+                emails.append(email)
+            else:
+                phones.append(match.group("phone"))
+
+        ctas = extract_cta_phrases(text)
 
     # Return structured signals
     return {
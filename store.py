@@ -9,10 +9,19 @@
 # ================================================================
 
 # Import required modules
-import json
 import csv
+import json
+import os
 from typing import List, Dict
 
+# orjson encodes JSON in native code (several times faster than the
+# stdlib's pure-Python formatting on big result lists); fall back to
+# the stdlib json module if it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def save_as_json(data: List[Dict], filename: str) -> None:
     """
@@ -22,7 +31,13 @@ def save_as_json(data: List[Dict], filename: str) -> None:
         data (List[Dict]): List of structured data (docs or signals).
         filename (str): File path to save JSON.
     """
-    # Open the file in write mode with UTF-8 encoding
+    if orjson is not None:
+        # orjson produces the encoded bytes in one native-code call
+        with open(filename, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    # Fallback: open the file in write mode with UTF-8 encoding
     with open(filename, "w", encoding="utf-8") as f:
         # Dump the data into JSON with indentation for readability
         json.dump(data, f, ensure_ascii=False, indent=2)
@@ -44,14 +59,39 @@ def save_as_csv(data: List[Dict], filename: str) -> None:
 
     # Open the file in write mode with newline='' to prevent blank lines
     with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        # Plain csv.writer over precomputed tuples: skips DictWriter's
+        # per-row Python dispatch and field validation, and writerows
+        # drains the generator inside the C csv module
+        writer = csv.writer(f)
 
         # Write header row
-        writer.writeheader()
+        writer.writerow(fieldnames)
 
         # Write all rows of data
-        for row in data:
-            writer.writerow(row)
+        writer.writerows(
+            tuple(row.get(k, "") for k in fieldnames) for row in data)
+
+
+def save_results(documents: List[Dict], signals: List[Dict],
+                 output_format: str = "json", output_dir: str = "output") -> None:
+    """
+    Save crawled documents and extracted signals in the chosen format.
+
+    Args:
+        documents (List[Dict]): Parsed (and enriched) documents.
+        signals (List[Dict]): Extracted per-page signal dictionaries.
+        output_format (str): "json" or "csv".
+        output_dir (str): Directory where the files are written.
+    """
+    # Make sure the output directory exists
+    os.makedirs(output_dir, exist_ok=True)
+
+    # Pick the writer matching the requested format
+    save = save_as_json if output_format == "json" else save_as_csv
+
+    # Write documents and signals side by side
+    save(documents, os.path.join(output_dir, f"documents.{output_format}"))
+    save(signals, os.path.join(output_dir, f"signals.{output_format}"))
 
 
 def store_results(results: List[Dict], base_filename: str) -> None: